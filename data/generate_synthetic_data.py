@@ -1,280 +1,520 @@
 import json
-import random
 from datetime import datetime, timedelta
-from typing import List, Dict
-import uuid
+from typing import List, Dict, Iterator, Sequence, Tuple
+from collections import defaultdict
+from enum import IntEnum
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; output is then encoded by the stdlib json module
+    orjson = None
+
+
+class CommitType(IntEnum):
+    INITIAL = 0
+    FEATURE = 1
+    BUGFIX = 2
+    UPDATE = 3
+    DOCS = 4
+    DESPERATE = 5
+
+
+# Message templates, indexed by CommitType
+MSG_TABLE = (
+    (  # INITIAL
+        'Initial commit',
+        'Project setup',
+        'Added project files',
+        'Started project'
+    ),
+    (  # FEATURE
+        'Implemented {} feature',
+        'Added {} functionality',
+        'Created {} module',
+        'Built {} component'
+    ),
+    (  # BUGFIX
+        'Fixed bug in {}',
+        'Resolved issue with {}',
+        'Corrected {} error',
+        'Debugged {}'
+    ),
+    (  # UPDATE
+        'Updated {}',
+        'Modified {}',
+        'Improved {}',
+        'Refactored {}'
+    ),
+    (  # DOCS
+        'Added documentation',
+        'Updated README',
+        'Added comments',
+        'Documented code'
+    ),
+    (  # DESPERATE
+        'Trying to fix everything',
+        'Please work',
+        'Last minute changes',
+        'Final updates',
+        'Hopefully this works'
+    )
+)
+
+FEATURES = ('login', 'database', 'API', 'UI', 'tests', 'validation', 'authentication')
+
+# Every template of these types has a '{}' slot for a feature name; the
+# remaining types never do, so no per-message check is needed
+_FEATURE_MESSAGE_TYPES = frozenset({
+    CommitType.FEATURE, CommitType.BUGFIX, CommitType.UPDATE
+})
+
+
+class CommitSize(IntEnum):
+    SMALL = 0
+    MEDIUM = 1
+    LARGE = 2
+
+
+# Lines added per commit (inclusive), indexed by CommitSize
+SIZE_RANGES = (
+    (5, 30),  # SMALL
+    (30, 100),  # MEDIUM
+    (100, 500)  # LARGE
+)
+
+
+class TimePreference(IntEnum):
+    MORNING = 0
+    AFTERNOON = 1
+    EVENING = 2
+    LATE_NIGHT = 3
+
+
+# Realistic hour distributions (inclusive) based on student work patterns,
+# indexed by TimePreference
+HOUR_RANGES = (
+    (8, 12),  # MORNING
+    (13, 17),  # AFTERNOON
+    (18, 23),  # EVENING
+    (0, 3)  # LATE_NIGHT
+)
+
+# Commits per team member by role: the leader makes 40-50% of commits,
+# contributors 30-40% and the last member only 10-20%
+TEAM_ROLE_COMMITS = {
+    'leader': (25, 35),
+    'contributor': (15, 25),
+    'minimal': (5, 12)
+}
+
+# Pools for parallel student generation. Threads avoid process startup and
+# pickling, and scale on free-threaded builds; processes sidestep the GIL.
+EXECUTORS = {
+    'process': ProcessPoolExecutor,
+    'thread': ThreadPoolExecutor
+}
+
+# Column lookups used when a whole schedule of commits is built at once
+_SIZE_LOW = np.array([low for low, _ in SIZE_RANGES])
+_SIZE_HIGH = np.array([high for _, high in SIZE_RANGES])
+
+_HOUR_LOW = np.array([low for low, _ in HOUR_RANGES])
+_HOUR_HIGH = np.array([high for _, high in HOUR_RANGES])
+
+_CONSISTENT_TYPES = np.array([CommitType.FEATURE, CommitType.UPDATE, CommitType.BUGFIX])
+_CONSISTENT_SIZES = np.array([CommitSize.SMALL, CommitSize.MEDIUM])
+_CONSISTENT_TIMES = np.array([TimePreference.AFTERNOON, TimePreference.EVENING])
+
+_DEADLINE_TYPES = np.array([CommitType.FEATURE, CommitType.BUGFIX, CommitType.DESPERATE])
+_DEADLINE_SIZES = np.array([CommitSize.MEDIUM, CommitSize.LARGE])
+_DEADLINE_TIMES = np.array([
+    TimePreference.LATE_NIGHT, TimePreference.LATE_NIGHT, TimePreference.EVENING
+])
+
+_TEAM_TYPES = np.array([
+    CommitType.FEATURE, CommitType.BUGFIX, CommitType.UPDATE, CommitType.DOCS
+])
+_TEAM_SIZES = np.array([CommitSize.SMALL, CommitSize.MEDIUM, CommitSize.LARGE])
+_TEAM_TIMES = np.array([
+    TimePreference.AFTERNOON, TimePreference.EVENING, TimePreference.LATE_NIGHT
+])
+
+
+# Schedule kernels. Each returns (days, types, sizes, time_prefs) as int
+# arrays; rng.integers(low, high) excludes high, so inclusive ranges add 1.
+# Every phase knows its commit count up front, so the columns are
+# allocated once at their final length and each phase's random values are
+# drawn in one call and written into its slice.
+
+def _pick(rng, options, count):
+    # count uniform choices from options, in a single draw
+    return options[rng.integers(0, len(options), size=count)]
+
+
+def _empty_schedule(num_commits):
+    return (np.empty(num_commits, dtype=np.int64),
+            np.empty(num_commits, dtype=np.int64),
+            np.empty(num_commits, dtype=np.int64),
+            np.empty(num_commits, dtype=np.int64))
+
+
+def _consistent_schedule(rng, duration_days):
+    # Regular commit schedule, every 2-4 days. Steps are at least 2 days,
+    # so this many steps always runs past the end of the course.
+    regular_days = np.cumsum(rng.integers(2, 5, size=duration_days // 2 + 1))
+    regular_days = regular_days[regular_days < duration_days]
+    
+    # Some documentation commits
+    num_docs = rng.integers(2, 5)
+    
+    # Initial commit, then regular commits, then docs from index `docs`
+    docs = 1 + len(regular_days)
+    days, types, sizes, time_prefs = _empty_schedule(docs + num_docs)
+    
+    days[0] = 0
+    days[1:docs] = regular_days
+    days[docs:] = rng.integers(0, duration_days + 1, size=num_docs)
+    
+    types[0] = CommitType.INITIAL
+    types[1:docs] = _pick(rng, _CONSISTENT_TYPES, docs - 1)
+    types[docs:] = CommitType.DOCS
+    
+    sizes[0] = CommitSize.SMALL
+    sizes[1:docs] = _pick(rng, _CONSISTENT_SIZES, docs - 1)
+    sizes[docs:] = CommitSize.SMALL
+    
+    time_prefs[0] = TimePreference.MORNING
+    time_prefs[1:docs] = _pick(rng, _CONSISTENT_TIMES, docs - 1)
+    time_prefs[docs:] = TimePreference.EVENING
+    return days, types, sizes, time_prefs
+
+
+def _procrastinator_schedule(rng, duration_days):
+    # Few commits in first 2/3 of semester, then a burst in the final third
+    early_period = int(duration_days * 0.66)
+    num_early = rng.integers(2, 6)
+    num_late = rng.integers(15, 26)
+    
+    # Initial commit, then early commits, then the burst from index `late`
+    late = 1 + num_early
+    days, types, sizes, time_prefs = _empty_schedule(late + num_late)
+    
+    days[0] = rng.integers(0, 8)
+    days[1:late] = rng.integers(10, early_period + 1, size=num_early)
+    days[late:] = rng.integers(early_period, duration_days, size=num_late)
+    
+    types[0] = CommitType.INITIAL
+    types[1:late] = CommitType.UPDATE
+    types[late:] = _pick(rng, _DEADLINE_TYPES, num_late)
+    
+    sizes[:late] = CommitSize.SMALL
+    sizes[late:] = _pick(rng, _DEADLINE_SIZES, num_late)
+    
+    time_prefs[0] = TimePreference.LATE_NIGHT
+    time_prefs[1:late] = TimePreference.EVENING
+    time_prefs[late:] = _pick(rng, _DEADLINE_TIMES, num_late)
+    return days, types, sizes, time_prefs
+
+
+def _struggling_schedule(rng, duration_days):
+    # Good start with regular activity in the first 1/3, then irregular
+    # small commits in the middle 1/3 and desperate attempts at the end
+    early_period = int(duration_days * 0.33)
+    middle_end = int(duration_days * 0.66)
+    regular_days = np.arange(2, early_period, rng.integers(3, 6))
+    num_middle = rng.integers(3, 7)
+    num_final = rng.integers(2, 5)
+    
+    # Phase boundaries: initial commit, regular, middle, final
+    middle = 1 + len(regular_days)
+    final = middle + num_middle
+    days, types, sizes, time_prefs = _empty_schedule(final + num_final)
+    
+    days[0] = 0
+    days[1:middle] = regular_days
+    days[middle:final] = rng.integers(early_period, middle_end + 1, size=num_middle)
+    days[final:] = rng.integers(middle_end, duration_days, size=num_final)
+    
+    types[0] = CommitType.INITIAL
+    types[1:middle] = CommitType.FEATURE
+    types[middle:final] = CommitType.BUGFIX
+    types[final:] = CommitType.DESPERATE
+    
+    sizes[:] = CommitSize.SMALL
+    
+    time_prefs[0] = TimePreference.MORNING
+    time_prefs[1:middle] = TimePreference.AFTERNOON
+    time_prefs[middle:] = TimePreference.LATE_NIGHT
+    return days, types, sizes, time_prefs
+
+
+def _inactive_schedule(rng, duration_days):
+    # Initial commit, then 1-3 sporadic commits throughout semester
+    num_sporadic = rng.integers(1, 4)
+    days, types, sizes, time_prefs = _empty_schedule(1 + num_sporadic)
+    
+    days[0] = rng.integers(0, 15)
+    days[1:] = rng.integers(14, duration_days, size=num_sporadic)
+    
+    types[0] = CommitType.INITIAL
+    types[1:] = CommitType.UPDATE
+    
+    sizes[:] = CommitSize.SMALL
+    
+    time_prefs[0] = TimePreference.EVENING
+    time_prefs[1:] = TimePreference.LATE_NIGHT
+    return days, types, sizes, time_prefs
+
+
+def _team_schedule(rng, duration_days, commit_counts):
+    # Like the student kernels, plus the index of each commit's author
+    members = np.repeat(np.arange(len(commit_counts)), commit_counts)
+    num_commits = len(members)
+    
+    days = rng.integers(0, duration_days, size=num_commits)
+    types = _pick(rng, _TEAM_TYPES, num_commits)
+    sizes = _pick(rng, _TEAM_SIZES, num_commits)
+    time_prefs = _pick(rng, _TEAM_TIMES, num_commits)
+    return members, days, types, sizes, time_prefs
+
+
+def _batch_file_changes(rng, size_idx: np.ndarray) -> Tuple[np.ndarray, ...]:
+    # Commit size fields for a column of CommitSize codes.
+    # Each draw's bounds depend on the one before, so additions comes first
+    # and deletions/files_changed are drawn against it elementwise.
+    additions = rng.integers(_SIZE_LOW[size_idx], _SIZE_HIGH[size_idx] + 1)
+    deletions = rng.integers(0, additions // 2 + 1)
+    files_changed = rng.integers(1, np.maximum(1, additions // 20) + 1)
+    return additions, deletions, files_changed, additions + deletions
+
 
 class StudentCommitGenerator:
     
-    def __init__(self, course_start_date: str, course_duration_weeks: int = 15):
+    def __init__(self, course_start_date: str, course_duration_weeks: int = 15,
+                 seed: int = None):
+        self.course_start_date = course_start_date
+        self.course_duration_weeks = course_duration_weeks
         self.start_date = datetime.strptime(course_start_date, '%Y-%m-%d')
         self.end_date = self.start_date + timedelta(weeks=course_duration_weeks)
         self.duration_days = (self.end_date - self.start_date).days
         
-    def generate_commit_timestamp(self, day_offset: int, hour_preference: str = 'evening') -> str:
-        commit_date = self.start_date + timedelta(days=day_offset)
-        
-        # Realistic hour distributions based on student work patterns
-        hour_ranges = {
-            'morning': (8, 12),
-            'afternoon': (13, 17),
-            'evening': (18, 23),
-            'late_night': (0, 3)
-        }
-        
-        hour_range = hour_ranges.get(hour_preference, (18, 23))
-        hour = random.randint(hour_range[0], hour_range[1])
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        
-        commit_datetime = commit_date.replace(hour=hour, minute=minute, second=second)
-        return commit_datetime.isoformat() + 'Z'
-    
-    def generate_commit_message(self, commit_type: str) -> str:
-        messages = {
-            'initial': [
-                'Initial commit',
-                'Project setup',
-                'Added project files',
-                'Started project'
-            ],
-            'feature': [
-                'Implemented {} feature',
-                'Added {} functionality',
-                'Created {} module',
-                'Built {} component'
-            ],
-            'bugfix': [
-                'Fixed bug in {}',
-                'Resolved issue with {}',
-                'Corrected {} error',
-                'Debugged {}'
-            ],
-            'update': [
-                'Updated {}',
-                'Modified {}',
-                'Improved {}',
-                'Refactored {}'
-            ],
-            'docs': [
-                'Added documentation',
-                'Updated README',
-                'Added comments',
-                'Documented code'
-            ],
-            'desperate': [
-                'Trying to fix everything',
-                'Please work',
-                'Last minute changes',
-                'Final updates',
-                'Hopefully this works'
-            ]
-        }
-        
-        features = ['login', 'database', 'API', 'UI', 'tests', 'validation', 'authentication']
-        
-        message_template = random.choice(messages[commit_type])
-        if '{}' in message_template:
-            return message_template.format(random.choice(features))
-        return message_template
-    
-    def generate_file_changes(self, commit_size: str) -> Dict:
-        size_ranges = {
-            'small': (5, 30),
-            'medium': (30, 100),
-            'large': (100, 500)
-        }
-        
-        additions = random.randint(*size_ranges[commit_size])
-        deletions = random.randint(0, additions // 2)
-        files_changed = random.randint(1, max(1, additions // 20))
+        self._rng = np.random.default_rng(seed)
+    
+    # The single-commit generators below are one-row calls into the same
+    # column helpers _create_commits uses, so there is one implementation
+    
+    def generate_commit_timestamp(self, day_offset: int,
+                                  time_pref: TimePreference = TimePreference.EVENING) -> str:
+        hours, minutes, seconds = self._draw_times(np.array([time_pref]))
+        offset = day_offset * 86400 + hours * 3600 + minutes * 60 + seconds
+        return self._iso_timestamps(offset)[0]
+    
+    def generate_commit_message(self, commit_type: CommitType) -> str:
+        return self._generate_commit_messages(np.array([commit_type]))[0]
+    
+    def _draw_times(self, time_idx: np.ndarray) -> Tuple[np.ndarray, ...]:
+        # Hour, minute and second columns for a column of TimePreference codes
+        rng = self._rng
+        hours = rng.integers(_HOUR_LOW[time_idx], _HOUR_HIGH[time_idx] + 1)
+        minutes = rng.integers(0, 60, size=len(time_idx))
+        seconds = rng.integers(0, 60, size=len(time_idx))
+        return hours, minutes, seconds
+    
+    def _iso_timestamps(self, offsets: np.ndarray) -> List[str]:
+        # 'YYYY-MM-DDTHH:MM:SSZ' for offsets in seconds from the course start
+        timestamps = np.datetime64(self.start_date, 's') + offsets.astype('timedelta64[s]')
+        return [timestamp + 'Z' for timestamp in
+                np.datetime_as_string(timestamps, unit='s').tolist()]
+    
+    def _generate_commit_messages(self, type_idx: np.ndarray) -> List[str]:
+        # Draw templates (and feature names) for all commits of a type at
+        # once, then scatter them back into commit order. Codes outside
+        # CommitType would match no type and silently yield None, so they
+        # are rejected up front.
+        if type_idx.dtype.kind not in 'iu':
+            raise ValueError(f"commit types must be integer CommitType codes, got {type_idx.dtype}")
+        if len(type_idx) and (type_idx.min() < 0 or type_idx.max() >= len(MSG_TABLE)):
+            raise ValueError(f"commit type codes must be in 0..{len(MSG_TABLE) - 1}")
+        
+        rng = self._rng
+        messages = np.empty(len(type_idx), dtype=object)
+        
+        for commit_type in CommitType:
+            mask = type_idx == commit_type
+            count = int(mask.sum())
+            if count == 0:
+                continue
+            
+            templates = MSG_TABLE[commit_type]
+            picks = [templates[i] for i in rng.integers(0, len(templates), size=count)]
+            if commit_type in _FEATURE_MESSAGE_TYPES:
+                features = rng.integers(0, len(FEATURES), size=count)
+                picks = [template.format(FEATURES[i])
+                         for template, i in zip(picks, features)]
+            messages[mask] = picks
+        
+        return messages.tolist()
+    
+    def generate_file_changes(self, commit_size: CommitSize) -> Dict:
+        additions, deletions, files_changed, total_changes = _batch_file_changes(
+            self._rng, np.array([commit_size])
+        )
         
         return {
-            'additions': additions,
-            'deletions': deletions,
-            'files_changed': files_changed,
-            'total_changes': additions + deletions
+            'additions': int(additions[0]),
+            'deletions': int(deletions[0]),
+            'files_changed': int(files_changed[0]),
+            'total_changes': int(total_changes[0])
         }
     
     def generate_consistent_student(self, student_id: str, repo_name: str) -> List[Dict]:
-        commits = []
-        commit_days = []
-        
-        # Generate regular commit schedule (2-4 commits per week)
-        current_day = 0
-        while current_day < self.duration_days:
-            # Commit every 2-3 days
-            current_day += random.randint(2, 4)
-            if current_day < self.duration_days:
-                commit_days.append(current_day)
-        
-        # Add initial commit
-        commits.append(self._create_commit(
-            student_id, repo_name, 0, 'initial', 'small', 'morning'
-        ))
-        
-        # Regular commits
-        for day in commit_days:
-            commit_type = random.choice(['feature', 'update', 'bugfix'])
-            commit_size = random.choice(['small', 'medium'])
-            time_pref = random.choice(['afternoon', 'evening'])
-            
-            commits.append(self._create_commit(
-                student_id, repo_name, day, commit_type, commit_size, time_pref
-            ))
-        
-        # Add some documentation commits
-        for _ in range(random.randint(2, 4)):
-            day = random.randint(0, self.duration_days)
-            commits.append(self._create_commit(
-                student_id, repo_name, day, 'docs', 'small', 'evening'
-            ))
-        
-        return sorted(commits, key=lambda x: x['timestamp'])
+        schedule = _consistent_schedule(self._rng, self.duration_days)
+        return self._create_commits([student_id], repo_name, schedule)
     
     def generate_procrastinator_student(self, student_id: str, repo_name: str) -> List[Dict]:
-        commits = []
-        
-        # Initial commit
-        commits.append(self._create_commit(
-            student_id, repo_name, random.randint(0, 7), 'initial', 'small', 'late_night'
-        ))
-        
-        # Few commits in first 2/3 of semester
-        early_period = int(self.duration_days * 0.66)
-        for _ in range(random.randint(2, 5)):
-            day = random.randint(10, early_period)
-            commits.append(self._create_commit(
-                student_id, repo_name, day, 'update', 'small', 'evening'
-            ))
-        
-        # Burst of commits in final third
-        late_period_start = early_period
-        for _ in range(random.randint(15, 25)):
-            day = random.randint(late_period_start, self.duration_days - 1)
-            commit_type = random.choice(['feature', 'bugfix', 'desperate'])
-            commit_size = random.choice(['medium', 'large'])
-            time_pref = random.choice(['late_night', 'late_night', 'evening'])
-            
-            commits.append(self._create_commit(
-                student_id, repo_name, day, commit_type, commit_size, time_pref
-            ))
-        
-        return sorted(commits, key=lambda x: x['timestamp'])
+        schedule = _procrastinator_schedule(self._rng, self.duration_days)
+        return self._create_commits([student_id], repo_name, schedule)
     
     def generate_struggling_student(self, student_id: str, repo_name: str) -> List[Dict]:
-        commits = []
-        
-        # Good start
-        commits.append(self._create_commit(
-            student_id, repo_name, 0, 'initial', 'small', 'morning'
-        ))
-        
-        # Regular activity first 1/3
-        early_period = int(self.duration_days * 0.33)
-        for day in range(2, early_period, random.randint(3, 5)):
-            commits.append(self._create_commit(
-                student_id, repo_name, day, 'feature', 'small', 'afternoon'
-            ))
-        
-        # Declining activity middle 1/3 - irregular, small commits
-        middle_start = early_period
-        middle_end = int(self.duration_days * 0.66)
-        for _ in range(random.randint(3, 6)):
-            day = random.randint(middle_start, middle_end)
-            commits.append(self._create_commit(
-                student_id, repo_name, day, 'bugfix', 'small', 'late_night'
-            ))
-        
-        # Minimal activity final 1/3 - desperate attempts
-        for _ in range(random.randint(2, 4)):
-            day = random.randint(middle_end, self.duration_days - 1)
-            commits.append(self._create_commit(
-                student_id, repo_name, day, 'desperate', 'small', 'late_night'
-            ))
-        
-        return sorted(commits, key=lambda x: x['timestamp'])
+        schedule = _struggling_schedule(self._rng, self.duration_days)
+        return self._create_commits([student_id], repo_name, schedule)
     
     def generate_inactive_student(self, student_id: str, repo_name: str) -> List[Dict]:
-        commits = []
-        
-        # Initial commit only
-        commits.append(self._create_commit(
-            student_id, repo_name, random.randint(0, 14), 'initial', 'small', 'evening'
-        ))
-        
-        # 1-3 sporadic commits throughout semester
-        for _ in range(random.randint(1, 3)):
-            day = random.randint(14, self.duration_days - 1)
-            commits.append(self._create_commit(
-                student_id, repo_name, day, 'update', 'small', 'late_night'
-            ))
-        
-        return sorted(commits, key=lambda x: x['timestamp'])
+        schedule = _inactive_schedule(self._rng, self.duration_days)
+        return self._create_commits([student_id], repo_name, schedule)
     
     def generate_team_project(self, team_members: List[str], repo_name: str) -> List[Dict]:
-        all_commits = []
+        last = len(team_members) - 1
+        roles = ['leader' if i == 0 else 'minimal' if i == last else 'contributor'
+                 for i in range(len(team_members))]
         
-        roles = ['leader', 'contributor', 'minimal']
-        member_roles = {}
+        # Generate commit counts based on roles, in one draw
+        low = np.array([TEAM_ROLE_COMMITS[role][0] for role in roles], dtype=np.int64)
+        high = np.array([TEAM_ROLE_COMMITS[role][1] for role in roles], dtype=np.int64)
+        commit_counts = self._rng.integers(low, high + 1)
         
-        for i, member in enumerate(team_members):
-            if i == 0:
-                member_roles[member] = 'leader'
-            elif i < len(team_members) - 1:
-                member_roles[member] = 'contributor'
-            else:
-                member_roles[member] = 'minimal'
-        
-        # Generate commits based on roles
-        for member, role in member_roles.items():
-            if role == 'leader':
-                # 40-50% of commits
-                commit_count = random.randint(25, 35)
-            elif role == 'contributor':
-                # 30-40% of commits
-                commit_count = random.randint(15, 25)
-            else:
-                # 10-20% of commits
-                commit_count = random.randint(5, 12)
-            
-            for _ in range(commit_count):
-                day = random.randint(0, self.duration_days - 1)
-                commit_type = random.choice(['feature', 'bugfix', 'update', 'docs'])
-                commit_size = random.choice(['small', 'medium', 'large'])
-                time_pref = random.choice(['afternoon', 'evening', 'late_night'])
-                
-                all_commits.append(self._create_commit(
-                    member, repo_name, day, commit_type, commit_size, time_pref
-                ))
-        
-        return sorted(all_commits, key=lambda x: x['timestamp'])
+        members, *schedule = _team_schedule(self._rng, self.duration_days, commit_counts)
+        return self._create_commits(team_members, repo_name, schedule, members)
     
-    def _create_commit(self, author: str, repo: str, day_offset: int, 
-                      commit_type: str, commit_size: str, time_pref: str) -> Dict:
-        return {
-            'commit_id': str(uuid.uuid4())[:8],
+    def _create_commits(self, authors: List[str], repo: str,
+                        schedule: Sequence[np.ndarray],
+                        members: np.ndarray = None) -> List[Dict]:
+        # The schedule is (days, types, sizes, time_prefs) code arrays from
+        # a schedule kernel, and members indexes each commit's author in
+        # authors (omitted for single-author repos). All random fields are
+        # drawn as whole columns, and commit dicts are only materialized
+        # once at the end.
+        days, type_idx, size_idx, time_idx = schedule
+        num_commits = len(days)
+        if num_commits == 0:
+            return []
+        
+        rng = self._rng
+        
+        # Time of day
+        hours, minutes, seconds = self._draw_times(time_idx)
+        
+        # Put commits in chronological order by a packed integer key, so
+        # everything below is generated already sorted. Only the columns
+        # drawn so far need reordering.
+        sort_key = days * 86400 + hours * 3600 + minutes * 60 + seconds
+        order = np.argsort(sort_key, kind='stable')
+        sort_key, type_idx, size_idx = sort_key[order], type_idx[order], size_idx[order]
+        if members is None:
+            commit_authors = repeat(authors[0], num_commits)
+        else:
+            commit_authors = [authors[i] for i in members[order].tolist()]
+        
+        # Timestamps: the sort key is already seconds since the course start
+        timestamps = self._iso_timestamps(sort_key)
+        
+        additions, deletions, files_changed, total_changes = _batch_file_changes(
+            rng, size_idx
+        )
+        
+        messages = self._generate_commit_messages(type_idx)
+        
+        # Short commit ids: one bulk draw of 4 random bytes per commit
+        hex_ids = rng.bytes(4 * num_commits).hex()
+        commit_ids = [hex_ids[i:i + 8] for i in range(0, 8 * num_commits, 8)]
+        
+        commits = [{
+            'commit_id': commit_id,
             'repository': repo,
             'author': author,
-            'timestamp': self.generate_commit_timestamp(day_offset, time_pref),
-            'message': self.generate_commit_message(commit_type),
-            'changes': self.generate_file_changes(commit_size),
+            'timestamp': timestamp,
+            'message': message,
+            'changes': {
+                'additions': added,
+                'deletions': deleted,
+                'files_changed': files,
+                'total_changes': total
+            },
             'branch': 'main'
-        }
+        } for commit_id, author, timestamp, message, added, deleted, files, total in zip(
+            commit_ids, commit_authors, timestamps, messages, additions.tolist(),
+            deletions.tolist(), files_changed.tolist(), total_changes.tolist())]
+        
+        return commits
     
     def generate_course_dataset(self, num_students: int = 50, 
-                               num_teams: int = 5) -> Dict:
-        dataset = {
-            'course_info': {
-                'start_date': self.start_date.isoformat(),
-                'end_date': self.end_date.isoformat(),
-                'duration_weeks': self.duration_days // 7,
-                'generated_at': datetime.now().isoformat()
-            },
-            'individual_projects': [],
-            'team_projects': []
+                               num_teams: int = 5, workers: int = None,
+                               executor: str = 'process') -> Dict:
+        return {
+            'course_info': self._course_info(),
+            'individual_projects': list(
+                self.iter_individual_projects(num_students, workers, executor)
+            ),
+            'team_projects': list(self.iter_team_projects(num_teams))
+        }
+    
+    def write_course_dataset(self, f, num_students: int = 50,
+                             num_teams: int = 5, workers: int = None,
+                             executor: str = 'process') -> Dict:
+        # Stream the dataset to an open text file one project at a time so
+        # memory stays flat regardless of course size. Returns the counts
+        # that would otherwise be read back from the full dataset.
+        stats = {
+            'individual_projects': 0,
+            'team_projects': 0,
+            'individual_commits': 0,
+            'team_commits': 0,
+            'pattern_counts': defaultdict(int)
         }
         
+        f.write('{\n"course_info": ')
+        f.write(_dumps(self._course_info()))
+        
+        f.write(',\n"individual_projects": [\n')
+        for project in self.iter_individual_projects(num_students, workers, executor):
+            _write_project(f, project, first=stats['individual_projects'] == 0)
+            stats['individual_projects'] += 1
+            stats['individual_commits'] += project['total_commits']
+            stats['pattern_counts'][project['pattern_type']] += 1
+        
+        f.write('\n],\n"team_projects": [\n')
+        for project in self.iter_team_projects(num_teams):
+            _write_project(f, project, first=stats['team_projects'] == 0)
+            stats['team_projects'] += 1
+            stats['team_commits'] += project['total_commits']
+        
+        f.write('\n]\n}\n')
+        return stats
+    
+    def _course_info(self) -> Dict:
+        return {
+            'start_date': self.start_date.isoformat(),
+            'end_date': self.end_date.isoformat(),
+            'duration_weeks': self.duration_days // 7,
+            'generated_at': datetime.now().isoformat()
+        }
+    
+    def iter_individual_projects(self, num_students: int = 50, workers: int = None,
+                                 executor: str = 'process') -> Iterator[Dict]:
         # Generate individual student projects
         pattern_distribution = {
             'consistent': int(num_students * 0.35),  # 35%
@@ -282,49 +522,83 @@ class StudentCommitGenerator:
             'struggling': int(num_students * 0.20),  # 20%
             'inactive': int(num_students * 0.20)  # 20%
         }
+        patterns = [pattern for pattern, count in pattern_distribution.items()
+                    for _ in range(count)]
+        
+        # Every student gets their own seeded generator, so no RNG is shared
+        # between workers and the output does not depend on how (or how
+        # many) workers generated it
+        seeds = self._rng.integers(0, 2**63 - 1, size=len(patterns)).tolist()
+        tasks = [(self.course_start_date, self.course_duration_weeks,
+                  pattern, f'student_{i:03d}', seed)
+                 for i, (pattern, seed) in enumerate(zip(patterns, seeds))]
+        
+        if workers and workers > 1:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with EXECUTORS[executor](max_workers=workers) as pool:
+                yield from pool.map(_generate_student_project, tasks,
+                                    chunksize=chunksize)
+        else:
+            yield from map(_generate_student_project, tasks)
+    
+    def generate_student_project(self, pattern: str, student_id: str) -> Dict:
+        repo_name = f'{student_id}_project'
+        
+        if pattern == 'consistent':
+            commits = self.generate_consistent_student(student_id, repo_name)
+        elif pattern == 'procrastinator':
+            commits = self.generate_procrastinator_student(student_id, repo_name)
+        elif pattern == 'struggling':
+            commits = self.generate_struggling_student(student_id, repo_name)
+        else:  # inactive
+            commits = self.generate_inactive_student(student_id, repo_name)
         
-        student_count = 0
-        for pattern, count in pattern_distribution.items():
-            for i in range(count):
-                student_id = f'student_{student_count:03d}'
-                repo_name = f'{student_id}_project'
-                
-                if pattern == 'consistent':
-                    commits = self.generate_consistent_student(student_id, repo_name)
-                elif pattern == 'procrastinator':
-                    commits = self.generate_procrastinator_student(student_id, repo_name)
-                elif pattern == 'struggling':
-                    commits = self.generate_struggling_student(student_id, repo_name)
-                else:  # inactive
-                    commits = self.generate_inactive_student(student_id, repo_name)
-                
-                dataset['individual_projects'].append({
-                    'student_id': student_id,
-                    'repository': repo_name,
-                    'pattern_type': pattern,
-                    'total_commits': len(commits),
-                    'commits': commits
-                })
-                
-                student_count += 1
-        
+        return {
+            'student_id': student_id,
+            'repository': repo_name,
+            'pattern_type': pattern,
+            'total_commits': len(commits),
+            'commits': commits
+        }
+    
+    def iter_team_projects(self, num_teams: int = 5) -> Iterator[Dict]:
         # Generate team projects
         for team_num in range(num_teams):
-            team_size = random.randint(3, 5)
+            team_size = int(self._rng.integers(3, 6))
             team_members = [f'team_{team_num}_member_{i}' for i in range(team_size)]
             repo_name = f'team_{team_num}_project'
             
             commits = self.generate_team_project(team_members, repo_name)
             
-            dataset['team_projects'].append({
+            yield {
                 'team_id': f'team_{team_num}',
                 'repository': repo_name,
                 'members': team_members,
                 'total_commits': len(commits),
                 'commits': commits
-            })
-        
-        return dataset
+            }
+
+
+def _generate_student_project(task: Tuple) -> Dict:
+    # Module-level so it can be pickled into worker processes; also safe
+    # to run from threads since the generator is local to the call
+    course_start_date, course_duration_weeks, pattern, student_id, seed = task
+    generator = StudentCommitGenerator(course_start_date, course_duration_weeks, seed)
+    return generator.generate_student_project(pattern, student_id)
+
+
+def _write_project(f, project: Dict, first: bool):
+    if not first:
+        f.write(',\n')
+    f.write(_dumps(project))
+
+
+def _dumps(obj) -> str:
+    # Same layout as json.dumps(obj, indent=2), but encoded natively by
+    # orjson when it is installed
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
 
 def main():
@@ -336,27 +610,25 @@ def main():
         course_duration_weeks=15
     )
     
-    # Generate dataset
-    dataset = generator.generate_course_dataset(
-        num_students=50,
-        num_teams=5
-    )
-    
-    # Save to JSON file
+    # Generate dataset and stream it to JSON as each project is built
     output_file = 'synthetic_student_commits.json'
     with open(output_file, 'w') as f:
-        json.dump(dataset, f, indent=2)
+        stats = generator.write_course_dataset(
+            f,
+            num_students=50,
+            num_teams=5
+        )
     
     print(f"\n✓ Dataset generated successfully!")
     print(f"  - Output file: {output_file}")
-    print(f"  - Individual projects: {len(dataset['individual_projects'])}")
-    print(f"  - Team projects: {len(dataset['team_projects'])}")
-    print(f"  - Total commits: {sum(p['total_commits'] for p in dataset['individual_projects'])} (individual)")
-    print(f"                  + {sum(p['total_commits'] for p in dataset['team_projects'])} (team)")
+    print(f"  - Individual projects: {stats['individual_projects']}")
+    print(f"  - Team projects: {stats['team_projects']}")
+    print(f"  - Total commits: {stats['individual_commits']} (individual)")
+    print(f"                  + {stats['team_commits']} (team)")
     
     print("\n  Pattern distribution:")
     for pattern in ['consistent', 'procrastinator', 'struggling', 'inactive']:
-        count = sum(1 for p in dataset['individual_projects'] if p['pattern_type'] == pattern)
+        count = stats['pattern_counts'][pattern]
         print(f"    - {pattern}: {count} students")
 
 
@@ -1,8 +1,162 @@
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
-from collections import defaultdict
-import statistics
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Tuple, Optional, Iterator
+from collections import Counter
+import heapq
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON is then handled by the stdlib json module
+    orjson = None
+
+
+# Time-of-day bucket per hour: 0 late night [0, 6) and [23, 24),
+# 1 morning [6, 12), 2 afternoon [12, 18), 3 evening [18, 23)
+HOUR_BUCKETS = np.array([0] * 6 + [1] * 6 + [2] * 6 + [3] * 5 + [0], dtype=np.int64)
+
+# Student flag rules as (type, severity, check, description, metric value).
+# Each callable takes the activity, quality, temporal and progress metrics;
+# check also receives the analyzer thresholds
+FLAG_RULES = (
+    ('inactivity', 'high',
+     lambda a, q, t, p, th: a['longest_gap_days'] > th['inactivity_days'],
+     lambda a, q, t, p: f"Longest gap between commits: {a['longest_gap_days']} days",
+     lambda a, q, t, p: a['longest_gap_days']),
+    ('low_progress', 'high',
+     lambda a, q, t, p, th: p['active_weeks_ratio'] < th['low_progress_threshold'],
+     lambda a, q, t, p: f"Active in only {p['active_weeks']} weeks ({p['active_weeks_ratio']*100:.0f}%)",
+     lambda a, q, t, p: p['active_weeks_ratio']),
+    ('procrastination', 'medium',
+     lambda a, q, t, p, th: t['procrastination_indicator'] > th['procrastination_threshold'],
+     lambda a, q, t, p: f"{t['procrastination_indicator']*100:.0f}% of commits in final third of course",
+     lambda a, q, t, p: t['procrastination_indicator']),
+    ('declining_activity', 'medium',
+     lambda a, q, t, p, th: p['trend'] == 'declining',
+     lambda a, q, t, p: "Commit activity has declined significantly over time",
+     lambda a, q, t, p: p['trend']),
+    ('minimal_progress', 'low',
+     lambda a, q, t, p, th: q['small_commit_ratio'] > th['small_commit_ratio'],
+     lambda a, q, t, p: f"{q['small_commit_ratio']*100:.0f}% of commits are very small",
+     lambda a, q, t, p: q['small_commit_ratio']),
+    ('burnout_risk', 'low',
+     lambda a, q, t, p, th: t['late_night_work_ratio'] > th['late_night_ratio'],
+     lambda a, q, t, p: f"{t['late_night_work_ratio']*100:.0f}% of commits between 11pm-6am",
+     lambda a, q, t, p: t['late_night_work_ratio']),
+    ('irregular_pattern', 'medium',
+     lambda a, q, t, p, th: a['pattern'] == 'irregular',
+     lambda a, q, t, p: "Highly irregular commit pattern detected",
+     lambda a, q, t, p: a['consistency_score']),
+)
+
+# Weight of each flag severity in a student's overall severity
+SEVERITY_SCORES = {'high': 3, 'medium': 2, 'low': 1}
+
+# Words that mark a commit message as trivial; matched anywhere in the
+# message, case-insensitively, so "Fixed" and "updates" count too
+TRIVIAL_MESSAGE_RE = re.compile('fix|update|change', re.IGNORECASE)
+
+# Recommendation per flag type, in the order they are reported; flag types
+# that share a recommendation are folded onto one key through REC_ALIASES
+REC_TABLE = {
+    'inactivity': "⚠️ Reach out immediately - student may have dropped or be struggling",
+    'declining_activity': "📉 Check in with student - activity declining, may need support or clarification",
+    'procrastination': "⏰ Encourage earlier start on work - most progress happening near deadline",
+    'minimal_progress': "🔍 Review commit content - many small commits may indicate confusion or lack of direction",
+    'burnout_risk': "💤 Discuss time management - excessive late-night work may lead to burnout",
+    'irregular_pattern': "📅 Suggest setting regular work schedule to maintain steady progress",
+}
+REC_ALIASES = {'low_progress': 'inactivity'}
+
+# Per-student fields read by the summary and the priority list
+PRIORITY_FIELDS = ('student_id', 'repository', 'severity', 'flags', 'recommendations')
+
+# Below this many projects a process pool costs more than it saves
+PARALLEL_MIN_PROJECTS = 50
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Timestamps are held in microseconds so fractional seconds survive
+US_PER_HOUR = 3600 * 10**6
+US_PER_DAY = 24 * US_PER_HOUR
+
+
+def _timestamp_micros(timestamp: str) -> int:
+    # Commit timestamps are 'YYYY-MM-DDTHH:MM:SSZ', so slice the fields at
+    # fixed offsets and only convert the (few distinct) dates; anything
+    # else, fractional seconds included, goes through fromisoformat
+    if len(timestamp) == 20 and timestamp[-1] == 'Z':
+        return (_date_micros(timestamp[:10]) + int(timestamp[11:13]) * US_PER_HOUR
+                + (int(timestamp[14:16]) * 60 + int(timestamp[17:19])) * 10**6)
+    return int(np.datetime64(datetime.fromisoformat(timestamp.replace('Z', '')), 'us')
+               .astype(np.int64))
+
+
+@lru_cache(maxsize=4096)
+def _date_micros(day: str) -> int:
+    # Epoch microseconds at midnight of a 'YYYY-MM-DD' date
+    return (date.fromisoformat(day).toordinal() - _EPOCH_ORDINAL) * US_PER_DAY
+
+
+@dataclass
+class CommitBatch:
+    # A project's commits as columns, built once per analysis so each pass
+    # reads contiguous arrays instead of looking fields up commit by commit
+    timestamps: np.ndarray
+    sizes: np.ndarray
+    messages: List[str]
+    authors: List[str]
+    
+    @classmethod
+    def from_commits(cls, commits: List[Dict]) -> 'CommitBatch':
+        return cls(
+            timestamps=np.fromiter((_timestamp_micros(c['timestamp']) for c in commits),
+                                   dtype=np.int64, count=len(commits)).view('datetime64[us]'),
+            sizes=np.fromiter((c['changes']['total_changes'] for c in commits),
+                              dtype=np.int64, count=len(commits)),
+            messages=[c['message'] for c in commits],
+            authors=[c['author'] for c in commits]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.messages)
+    
+    @property
+    def micros(self) -> np.ndarray:
+        # Timestamps as int64 epoch microseconds, without copying
+        return self.timestamps.view(np.int64)
+
+
+# Metric reductions over a student's timestamps as int64 epoch microseconds.
+# Each is a few whole-array NumPy passes rather than a per-commit loop.
+
+def _gap_stats(sorted_micros: np.ndarray) -> Tuple[int, float, float, int]:
+    # Count, mean, sample variance and max of the whole-day gaps between
+    # consecutive timestamps (ascending)
+    gaps = np.diff(sorted_micros) // US_PER_DAY
+    if len(gaps) == 0:
+        return 0, 0, 0.0, 0
+    variance = float(gaps.var(ddof=1)) if len(gaps) > 1 else 0.0
+    return len(gaps), float(gaps.mean()), variance, int(gaps.max())
+
+
+def _hour_buckets(micros: np.ndarray, final_third_start: int) -> Tuple[List[int], int]:
+    # Commits per HOUR_BUCKETS bucket, plus how many were made at or after
+    # final_third_start
+    counts = np.bincount(HOUR_BUCKETS[(micros // US_PER_HOUR) % 24], minlength=4)
+    return counts.tolist(), int((micros >= final_third_start).sum())
+
+
+def _weekly_agg(micros: np.ndarray, course_start: int, course_weeks: int) -> np.ndarray:
+    # Commits per course week; commits outside the course are dropped
+    weeks = (micros - course_start) // (7 * US_PER_DAY)
+    in_course = (weeks >= 0) & (weeks < course_weeks)
+    return np.bincount(weeks[in_course], minlength=max(course_weeks, 0))
 
 
 class StudentAnalyzer:
@@ -17,22 +171,28 @@ class StudentAnalyzer:
             'late_night_ratio': 0.5
         }
     
-    def analyze_student(self, student_data: Dict, course_info: Dict) -> Dict:
+    def analyze_student(self, student_data: Dict, course_info: Dict,
+                        analysis_date: Optional[str] = None) -> Dict:
         commits = student_data['commits']
+        if analysis_date is None:
+            analysis_date = datetime.now().isoformat()
         
         if not commits:
             return self._create_alert('inactive', student_data, 
-                                     'No commits detected', severity='high')
+                                     'No commits detected', severity='high',
+                                     analysis_date=analysis_date)
+        
+        batch = CommitBatch.from_commits(commits)
         
         # Run all analysis functions
-        activity_pattern = self._analyze_activity_pattern(commits, course_info)
-        commit_quality = self._analyze_commit_quality(commits)
-        temporal_analysis = self._analyze_temporal_patterns(commits, course_info)
-        progress_tracking = self._track_progress_over_time(commits, course_info)
+        activity_pattern = self._analyze_activity_pattern(batch, course_info)
+        commit_quality = self._analyze_commit_quality(batch)
+        temporal_analysis = self._analyze_temporal_patterns(batch, course_info)
+        progress_tracking = self._track_progress_over_time(batch, course_info)
         
         # Detect concerning patterns
-        flags = self._detect_flags(activity_pattern, commit_quality, 
-                                   temporal_analysis, progress_tracking)
+        flags, severity_score = self._detect_flags(activity_pattern, commit_quality, 
+                                                   temporal_analysis, progress_tracking)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(flags)
@@ -40,10 +200,10 @@ class StudentAnalyzer:
         return {
             'student_id': student_data['student_id'],
             'repository': student_data['repository'],
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': analysis_date,
             'total_commits': len(commits),
             'flags': flags,
-            'severity': self._calculate_severity(flags),
+            'severity': self._calculate_severity(severity_score),
             'recommendations': recommendations,
             'metrics': {
                 'activity_pattern': activity_pattern,
@@ -53,25 +213,17 @@ class StudentAnalyzer:
             }
         }
     
-    def _analyze_activity_pattern(self, commits: List[Dict], course_info: Dict) -> Dict:
-        if not commits:
+    def _analyze_activity_pattern(self, batch: CommitBatch, course_info: Dict) -> Dict:
+        if len(batch) == 0:
             return {'pattern': 'inactive', 'consistency_score': 0}
         
-        timestamps = [datetime.fromisoformat(c['timestamp'].replace('Z', '')) 
-                     for c in commits]
-        
-        # Calculate time gaps between commits
-        timestamps.sort()
-        gaps = [(timestamps[i+1] - timestamps[i]).days 
-                for i in range(len(timestamps) - 1)]
-        
-        # Metrics
-        avg_gap = statistics.mean(gaps) if gaps else 0
-        max_gap = max(gaps) if gaps else 0
+        # Time gaps between commits, in whole days
+        num_gaps, avg_gap, gap_variance, max_gap = _gap_stats(
+            np.sort(batch.micros)
+        )
         
         # Consistency score (0-1, higher is better)
-        if len(gaps) > 1:
-            gap_variance = statistics.variance(gaps)
+        if num_gaps > 1:
             consistency_score = 1 / (1 + gap_variance / 100)
         else:
             consistency_score = 0.5
@@ -91,39 +243,38 @@ class StudentAnalyzer:
             'consistency_score': round(consistency_score, 2),
             'average_days_between_commits': round(avg_gap, 1),
             'longest_gap_days': max_gap,
-            'total_commits': len(commits)
+            'total_commits': len(batch)
         }
 
-    def _analyze_commit_quality(self, commits: List[Dict]) -> Dict:
-        if not commits:
+    def _analyze_commit_quality(self, batch: CommitBatch) -> Dict:
+        if len(batch) == 0:
             return {'average_size': 0, 'quality_score': 0}
         
-        commit_sizes = [c['changes']['total_changes'] for c in commits]
-        avg_size = statistics.mean(commit_sizes)
+        sizes = batch.sizes
+        avg_size = float(sizes.mean())
         
         # Classify commits by size
-        small_commits = sum(1 for size in commit_sizes if size < 50)
-        medium_commits = sum(1 for size in commit_sizes if 50 <= size < 150)
-        large_commits = sum(1 for size in commit_sizes if size >= 150)
+        small_commits = int((sizes < 50).sum())
+        medium_commits = int(((sizes >= 50) & (sizes < 150)).sum())
+        large_commits = int((sizes >= 150).sum())
         
-        small_ratio = small_commits / len(commits)
+        small_ratio = small_commits / len(batch)
         
         # Quality score (heuristic based on commit sizes)
         if 0.3 <= small_ratio <= 0.6 and medium_commits > 0:
             quality_score = 0.8
         elif small_ratio > 0.8:
             quality_score = 0.4
-        elif large_commits / len(commits) > 0.5:
+        elif large_commits / len(batch) > 0.5:
             quality_score = 0.6
         else:
             quality_score = 0.7
         
         # Analyze commit messages
-        meaningful_messages = sum(1 for c in commits 
-                                 if len(c['message']) > 10 and 
-                                 not any(word in c['message'].lower() 
-                                        for word in ['fix', 'update', 'change']))
-        message_quality = meaningful_messages / len(commits)
+        search = TRIVIAL_MESSAGE_RE.search
+        meaningful_messages = sum(1 for message in batch.messages
+                                 if len(message) > 10 and not search(message))
+        message_quality = meaningful_messages / len(batch)
         
         return {
             'average_commit_size': round(avg_size, 1),
@@ -135,27 +286,21 @@ class StudentAnalyzer:
             'message_quality_ratio': round(message_quality, 2)
         }
     
-    def _analyze_temporal_patterns(self, commits: List[Dict], course_info: Dict) -> Dict:
-        timestamps = [datetime.fromisoformat(c['timestamp'].replace('Z', '')) 
-                     for c in commits]
-        
-        # Time of day distribution
-        hours = [ts.hour for ts in timestamps]
-        late_night = sum(1 for h in hours if h < 6 or h >= 23)
-        morning = sum(1 for h in hours if 6 <= h < 12)
-        afternoon = sum(1 for h in hours if 12 <= h < 18)
-        evening = sum(1 for h in hours if 18 <= h < 23)
-        
-        late_night_ratio = late_night / len(commits)
-        
-        # Deadline pressure indicator
+    def _analyze_temporal_patterns(self, batch: CommitBatch, course_info: Dict) -> Dict:
         start_date = datetime.fromisoformat(course_info['start_date'])
         end_date = datetime.fromisoformat(course_info['end_date'])
         course_duration = (end_date - start_date).days
-        
         final_third_start = start_date + timedelta(days=course_duration * 2/3)
-        final_third_commits = sum(1 for ts in timestamps if ts >= final_third_start)
-        procrastination_ratio = final_third_commits / len(commits)
+        
+        # Time of day distribution and deadline pressure in one counting pass
+        counts, final_third_commits = _hour_buckets(
+            batch.micros,
+            int(np.datetime64(final_third_start, 'us').astype(np.int64))
+        )
+        late_night, morning, afternoon, evening = counts
+        
+        late_night_ratio = late_night / len(batch)
+        procrastination_ratio = final_third_commits / len(batch)
         
         return {
             'late_night_work_ratio': round(late_night_ratio, 2),
@@ -169,35 +314,32 @@ class StudentAnalyzer:
             'final_third_commits': final_third_commits
         }
     
-    def _track_progress_over_time(self, commits: List[Dict], course_info: Dict) -> Dict:
+    def _track_progress_over_time(self, batch: CommitBatch, course_info: Dict) -> Dict:
         start_date = datetime.fromisoformat(course_info['start_date'])
         end_date = datetime.fromisoformat(course_info['end_date'])
         course_weeks = (end_date - start_date).days // 7
         
         # Organize commits by week
-        weekly_commits = defaultdict(int)
-        weekly_changes = defaultdict(int)
-        
-        for commit in commits:
-            timestamp = datetime.fromisoformat(commit['timestamp'].replace('Z', ''))
-            week_num = (timestamp - start_date).days // 7
-            if 0 <= week_num < course_weeks:
-                weekly_commits[week_num] += 1
-                weekly_changes[week_num] += commit['changes']['total_changes']
+        weekly_commits = _weekly_agg(
+            batch.micros,
+            int(np.datetime64(start_date, 'us').astype(np.int64)), course_weeks
+        )
+        active = weekly_commits > 0
         
         # Calculate trend
-        weeks_with_activity = len(weekly_commits)
+        weeks_with_activity = int(active.sum())
         active_weeks_ratio = weeks_with_activity / course_weeks if course_weeks > 0 else 0
         
-        # Detect declining trend
+        # Detect declining trend, averaging over the active weeks of each half
         if weeks_with_activity >= 3:
-            first_half_weeks = [w for w in weekly_commits.keys() if w < course_weeks // 2]
-            second_half_weeks = [w for w in weekly_commits.keys() if w >= course_weeks // 2]
+            half = course_weeks // 2
+            first_half_weeks = int(active[:half].sum())
+            second_half_weeks = weeks_with_activity - first_half_weeks
             
-            first_half_avg = (sum(weekly_commits[w] for w in first_half_weeks) / 
-                            len(first_half_weeks) if first_half_weeks else 0)
-            second_half_avg = (sum(weekly_commits[w] for w in second_half_weeks) / 
-                             len(second_half_weeks) if second_half_weeks else 0)
+            first_half_avg = (int(weekly_commits[:half].sum()) / first_half_weeks
+                              if first_half_weeks else 0)
+            second_half_avg = (int(weekly_commits[half:].sum()) / second_half_weeks
+                               if second_half_weeks else 0)
             
             if second_half_avg < first_half_avg * 0.5:
                 trend = 'declining'
@@ -211,88 +353,36 @@ class StudentAnalyzer:
         return {
             'active_weeks': weeks_with_activity,
             'active_weeks_ratio': round(active_weeks_ratio, 2),
-            'weekly_breakdown': dict(weekly_commits),
+            'weekly_breakdown': {week: int(weekly_commits[week])
+                                 for week in np.flatnonzero(active).tolist()},
             'trend': trend,
-            'average_commits_per_week': round(len(commits) / course_weeks, 1) if course_weeks > 0 else 0
+            'average_commits_per_week': round(len(batch) / course_weeks, 1) if course_weeks > 0 else 0
         }
     
     def _detect_flags(self, activity: Dict, quality: Dict, 
-                     temporal: Dict, progress: Dict) -> List[Dict]:
+                     temporal: Dict, progress: Dict) -> Tuple[List[Dict], int]:
+        # Returns the raised flags and their summed severity score
         flags = []
-        
-        # Flag 1: Inactivity
-        if activity['longest_gap_days'] > self.thresholds['inactivity_days']:
-            flags.append({
-                'type': 'inactivity',
-                'severity': 'high',
-                'description': f"Longest gap between commits: {activity['longest_gap_days']} days",
-                'metric_value': activity['longest_gap_days']
-            })
-        
-        # Flag 2: Low overall progress
-        if progress['active_weeks_ratio'] < self.thresholds['low_progress_threshold']:
-            flags.append({
-                'type': 'low_progress',
-                'severity': 'high',
-                'description': f"Active in only {progress['active_weeks']} weeks ({progress['active_weeks_ratio']*100:.0f}%)",
-                'metric_value': progress['active_weeks_ratio']
-            })
-        
-        # Flag 3: Procrastination
-        if temporal['procrastination_indicator'] > self.thresholds['procrastination_threshold']:
-            flags.append({
-                'type': 'procrastination',
-                'severity': 'medium',
-                'description': f"{temporal['procrastination_indicator']*100:.0f}% of commits in final third of course",
-                'metric_value': temporal['procrastination_indicator']
-            })
-        
-        # Flag 4: Declining activity trend
-        if progress['trend'] == 'declining':
-            flags.append({
-                'type': 'declining_activity',
-                'severity': 'medium',
-                'description': "Commit activity has declined significantly over time",
-                'metric_value': progress['trend']
-            })
-        
-        # Flag 5: Poor commit quality
-        if quality['small_commit_ratio'] > self.thresholds['small_commit_ratio']:
-            flags.append({
-                'type': 'minimal_progress',
-                'severity': 'low',
-                'description': f"{quality['small_commit_ratio']*100:.0f}% of commits are very small",
-                'metric_value': quality['small_commit_ratio']
-            })
-        
-        # Flag 6: Excessive late-night work
-        if temporal['late_night_work_ratio'] > self.thresholds['late_night_ratio']:
-            flags.append({
-                'type': 'burnout_risk',
-                'severity': 'low',
-                'description': f"{temporal['late_night_work_ratio']*100:.0f}% of commits between 11pm-6am",
-                'metric_value': temporal['late_night_work_ratio']
-            })
-        
-        # Flag 7: Irregular pattern
-        if activity['pattern'] == 'irregular':
-            flags.append({
-                'type': 'irregular_pattern',
-                'severity': 'medium',
-                'description': "Highly irregular commit pattern detected",
-                'metric_value': activity['consistency_score']
-            })
-        
-        return flags
+        total_score = 0
+        
+        thresholds = self.thresholds
+        for flag_type, severity, check, describe, value in FLAG_RULES:
+            if check(activity, quality, temporal, progress, thresholds):
+                flags.append({
+                    'type': flag_type,
+                    'severity': severity,
+                    'description': describe(activity, quality, temporal, progress),
+                    'metric_value': value(activity, quality, temporal, progress)
+                })
+                total_score += SEVERITY_SCORES[severity]
+        
+        return flags, total_score
     
-    def _calculate_severity(self, flags: List[Dict]) -> str:
-        if not flags:
+    def _calculate_severity(self, total_score: int) -> str:
+        # Every flag scores at least 1, so a zero score means no flags
+        if total_score == 0:
             return 'none'
-        
-        severity_scores = {'high': 3, 'medium': 2, 'low': 1}
-        total_score = sum(severity_scores[f['severity']] for f in flags)
-        
-        if total_score >= 5:
+        elif total_score >= 5:
             return 'high'
         elif total_score >= 3:
             return 'medium'
@@ -300,38 +390,8 @@ class StudentAnalyzer:
             return 'low'
     
     def _generate_recommendations(self, flags: List[Dict]) -> List[str]:
-        recommendations = []
-        flag_types = {f['type'] for f in flags}
-        
-        if 'inactivity' in flag_types or 'low_progress' in flag_types:
-            recommendations.append(
-                "⚠️ Reach out immediately - student may have dropped or be struggling"
-            )
-        
-        if 'declining_activity' in flag_types:
-            recommendations.append(
-                "📉 Check in with student - activity declining, may need support or clarification"
-            )
-        
-        if 'procrastination' in flag_types:
-            recommendations.append(
-                "⏰ Encourage earlier start on work - most progress happening near deadline"
-            )
-        
-        if 'minimal_progress' in flag_types:
-            recommendations.append(
-                "🔍 Review commit content - many small commits may indicate confusion or lack of direction"
-            )
-        
-        if 'burnout_risk' in flag_types:
-            recommendations.append(
-                "💤 Discuss time management - excessive late-night work may lead to burnout"
-            )
-        
-        if 'irregular_pattern' in flag_types:
-            recommendations.append(
-                "📅 Suggest setting regular work schedule to maintain steady progress"
-            )
+        flag_types = {REC_ALIASES.get(f['type'], f['type']) for f in flags}
+        recommendations = [msg for flag_type, msg in REC_TABLE.items() if flag_type in flag_types]
         
         if not recommendations:
             recommendations.append("✅ Student shows healthy work patterns - continue monitoring")
@@ -339,11 +399,11 @@ class StudentAnalyzer:
         return recommendations
     
     def _create_alert(self, alert_type: str, student_data: Dict, 
-                     description: str, severity: str) -> Dict:
+                     description: str, severity: str, analysis_date: str) -> Dict:
         return {
             'student_id': student_data['student_id'],
             'repository': student_data['repository'],
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': analysis_date,
             'total_commits': 0,
             'flags': [{
                 'type': alert_type,
@@ -364,14 +424,16 @@ class TeamAnalyzer:
         commits = team_data['commits']
         members = team_data['members']
         
+        batch = CommitBatch.from_commits(commits)
+        
         # Analyze individual contributions
-        member_contributions = self._analyze_contributions(commits, members)
+        member_contributions, commit_percentages = self._analyze_contributions(batch, members)
         
         # Detect imbalances
-        imbalance_flags = self._detect_contribution_imbalance(member_contributions)
+        imbalance_flags = self._detect_contribution_imbalance(commit_percentages)
         
         # Collaboration patterns
-        collaboration = self._analyze_collaboration_patterns(commits, course_info)
+        collaboration = self._analyze_collaboration_patterns(batch, course_info)
         
         return {
             'team_id': team_data['team_id'],
@@ -384,33 +446,47 @@ class TeamAnalyzer:
             'recommendations': self._generate_team_recommendations(imbalance_flags)
         }
     
-    def _analyze_contributions(self, commits: List[Dict], members: List[str]) -> Dict:
+    def _analyze_contributions(self, batch: CommitBatch,
+                               members: List[str]) -> Tuple[Dict, np.ndarray]:
+        # Returns the per-member report and the commit percentages as an
+        # array (one entry per distinct member) for the imbalance check
         contributions = {}
-        
-        for member in members:
-            member_commits = [c for c in commits if c['author'] == member]
-            total_changes = sum(c['changes']['total_changes'] for c in member_commits)
-            
+        members = list(dict.fromkeys(members))
+        num_commits = len(batch)
+        
+        # Commit counts and change totals per member, bucketed by member
+        # index in one pass; commits by non-members are ignored
+        member_index = {member: i for i, member in enumerate(members)}
+        codes = np.fromiter((member_index.get(author, -1) for author in batch.authors),
+                            dtype=np.int64, count=num_commits)
+        known = codes >= 0
+        counts = np.bincount(codes[known], minlength=len(members))
+        totals = np.bincount(codes[known], weights=batch.sizes[known],
+                             minlength=len(members)).astype(np.int64)
+        
+        percents = counts / num_commits * 100 if num_commits else np.zeros(len(members))
+        avg_sizes = np.divide(totals, counts, out=np.zeros(len(members)), where=counts > 0)
+        
+        for member, commit_count, percent, total_changes, avg_size in zip(
+                members, counts.tolist(), percents.tolist(), totals.tolist(), avg_sizes.tolist()):
             contributions[member] = {
-                'commit_count': len(member_commits),
-                'commit_percentage': len(member_commits) / len(commits) * 100 if commits else 0,
+                'commit_count': commit_count,
+                'commit_percentage': percent if num_commits else 0,
                 'total_changes': total_changes,
-                'average_commit_size': total_changes / len(member_commits) if member_commits else 0
+                'average_commit_size': avg_size if commit_count else 0
             }
         
-        return contributions
+        return contributions, percents
     
-    def _detect_contribution_imbalance(self, contributions: Dict) -> List[Dict]:
+    def _detect_contribution_imbalance(self, commit_percentages: np.ndarray) -> List[Dict]:
         flags = []
         
-        commit_percentages = [c['commit_percentage'] for c in contributions.values()]
-        
-        if not commit_percentages:
+        if len(commit_percentages) == 0:
             return flags
         
         # Check for severe imbalance
-        max_contribution = max(commit_percentages)
-        min_contribution = min(commit_percentages)
+        max_contribution = float(commit_percentages.max())
+        min_contribution = float(commit_percentages.min())
         
         if max_contribution > 60:
             flags.append({
@@ -428,25 +504,28 @@ class TeamAnalyzer:
         
         return flags
     
-    def _analyze_collaboration_patterns(self, commits: List[Dict], course_info: Dict) -> Dict:
-        timestamps = [datetime.fromisoformat(c['timestamp'].replace('Z', '')) 
-                     for c in commits]
-        
-        # Group commits by day
-        daily_commits = defaultdict(list)
-        for commit in commits:
-            ts = datetime.fromisoformat(commit['timestamp'].replace('Z', ''))
-            day_key = ts.date()
-            daily_commits[day_key].append(commit['author'])
+    def _analyze_collaboration_patterns(self, batch: CommitBatch, course_info: Dict) -> Dict:
+        if len(batch) == 0:
+            return {'collaborative_days': 0, 'total_active_days': 0, 'collaboration_ratio': 0}
+        
+        # Distinct authors per day, keyed by integer day number: unique
+        # (day, author) pairs, then the number of pairs falling on each day
+        author_ids = {}
+        authors = np.fromiter((author_ids.setdefault(author, len(author_ids))
+                               for author in batch.authors),
+                              dtype=np.int64, count=len(batch))
+        days = batch.micros // US_PER_DAY
+        day_authors = np.unique(days * len(author_ids) + authors)
+        authors_per_day = np.unique(day_authors // len(author_ids), return_counts=True)[1]
         
         # Days with multiple members active
-        collaborative_days = sum(1 for authors in daily_commits.values() 
-                               if len(set(authors)) > 1)
+        collaborative_days = int((authors_per_day > 1).sum())
+        active_days = len(authors_per_day)
         
         return {
             'collaborative_days': collaborative_days,
-            'total_active_days': len(daily_commits),
-            'collaboration_ratio': collaborative_days / len(daily_commits) if daily_commits else 0
+            'total_active_days': active_days,
+            'collaboration_ratio': collaborative_days / active_days
         }
     
     def _generate_team_recommendations(self, flags: List[Dict]) -> List[str]:
@@ -472,58 +551,126 @@ class TeamAnalyzer:
 
 class MonitoringAgent:
     
-    def __init__(self, alert_thresholds: Dict = None):
+    def __init__(self, alert_thresholds: Dict = None, workers: int = None):
         self.student_analyzer = StudentAnalyzer(alert_thresholds)
         self.team_analyzer = TeamAnalyzer()
+        self.workers = workers
     
     def analyze_course(self, dataset: Dict) -> Dict:
         print("🔍 Analyzing student commit patterns...\n")
         
         course_info = dataset['course_info']
+        analysis_date = datetime.now().isoformat()
         
         # Analyze individual students
-        individual_analyses = []
-        for student_data in dataset['individual_projects']:
-            analysis = self.student_analyzer.analyze_student(student_data, course_info)
-            individual_analyses.append(analysis)
+        individual_analyses = list(self.iter_individual_analyses(dataset, analysis_date))
         
         # Analyze teams
-        team_analyses = []
-        for team_data in dataset['team_projects']:
-            analysis = self.team_analyzer.analyze_team(team_data, course_info)
-            team_analyses.append(analysis)
+        team_analyses = list(self.iter_team_analyses(dataset))
         
         # Generate summary statistics
-        summary = self._generate_summary(individual_analyses, team_analyses)
+        summary = self._generate_summary(individual_analyses, len(team_analyses))
         
         # Prioritize students needing attention
         priority_list = self._prioritize_interventions(individual_analyses)
         
         return {
             'course_info': course_info,
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': analysis_date,
             'summary': summary,
             'individual_analyses': individual_analyses,
             'team_analyses': team_analyses,
             'priority_interventions': priority_list
         }
     
-    def _generate_summary(self, individual: List[Dict], teams: List[Dict]) -> Dict:
-        # Count flags by severity
-        high_priority = sum(1 for a in individual if a['severity'] == 'high')
-        medium_priority = sum(1 for a in individual if a['severity'] == 'medium')
-        low_priority = sum(1 for a in individual if a['severity'] == 'low')
-        no_concerns = sum(1 for a in individual if a['severity'] == 'none')
+    def write_course_analysis(self, f, dataset: Dict) -> Dict:
+        # Stream the analysis to an open text file one project at a time.
+        # Only the fields the summary and priority list read are kept per
+        # student, so the metrics never accumulate in memory. The summary
+        # and priority list go last, once every student has been seen, and
+        # are also returned for reporting.
+        print("🔍 Analyzing student commit patterns...\n")
         
-        # Common flag types
-        all_flags = [flag for a in individual for flag in a['flags']]
-        flag_counts = defaultdict(int)
-        for flag in all_flags:
-            flag_counts[flag['type']] += 1
+        course_info = dataset['course_info']
+        analysis_date = datetime.now().isoformat()
+        
+        f.write('{\n"course_info": ')
+        f.write(_dumps(course_info))
+        f.write(f',\n"analysis_date": {_dumps(analysis_date)}')
+        
+        f.write(',\n"individual_analyses": [\n')
+        students = []
+        for analysis in self.iter_individual_analyses(dataset, analysis_date):
+            _write_analysis(f, analysis, first=not students)
+            students.append({key: analysis[key] for key in PRIORITY_FIELDS})
+        
+        f.write('\n],\n"team_analyses": [\n')
+        num_teams = 0
+        for analysis in self.iter_team_analyses(dataset):
+            _write_analysis(f, analysis, first=num_teams == 0)
+            num_teams += 1
+        
+        results = {
+            'summary': self._generate_summary(students, num_teams),
+            'priority_interventions': self._prioritize_interventions(students)
+        }
+        f.write('\n],\n"summary": ')
+        f.write(_dumps(results['summary']))
+        f.write(',\n"priority_interventions": ')
+        f.write(_dumps(results['priority_interventions']))
+        f.write('\n}\n')
+        return results
+    
+    def iter_individual_analyses(self, dataset: Dict,
+                                 analysis_date: Optional[str] = None) -> Iterator[Dict]:
+        course_info = dataset['course_info']
+        if analysis_date is None:
+            analysis_date = datetime.now().isoformat()
+        
+        yield from self._map(
+            partial(_analyze_student, thresholds=self.student_analyzer.thresholds,
+                    course_info=course_info, analysis_date=analysis_date),
+            partial(self.student_analyzer.analyze_student, course_info=course_info,
+                    analysis_date=analysis_date),
+            dataset['individual_projects']
+        )
+    
+    def iter_team_analyses(self, dataset: Dict) -> Iterator[Dict]:
+        course_info = dataset['course_info']
+        
+        yield from self._map(
+            partial(_analyze_team, course_info=course_info),
+            partial(self.team_analyzer.analyze_team, course_info=course_info),
+            dataset['team_projects']
+        )
+    
+    def _map(self, worker, local, projects: List[Dict]) -> Iterator[Dict]:
+        # Projects are independent, so large courses fan out over a process
+        # pool; results come back in input order either way
+        if self.workers and self.workers > 1 and len(projects) > PARALLEL_MIN_PROJECTS:
+            chunksize = max(1, len(projects) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                yield from pool.map(worker, projects, chunksize=chunksize)
+        else:
+            for project in projects:
+                yield local(project)
+    
+    def _generate_summary(self, individual: List[Dict], num_teams: int) -> Dict:
+        # Count students by severity and flags by type in one pass
+        severity_counts = Counter()
+        flag_counts = Counter()
+        for a in individual:
+            severity_counts[a['severity']] += 1
+            flag_counts.update(flag['type'] for flag in a['flags'])
+        
+        high_priority = severity_counts['high']
+        medium_priority = severity_counts['medium']
+        low_priority = severity_counts['low']
+        no_concerns = severity_counts['none']
         
         return {
             'total_students': len(individual),
-            'total_teams': len(teams),
+            'total_teams': num_teams,
             'students_needing_attention': high_priority + medium_priority,
             'severity_breakdown': {
                 'high': high_priority,
@@ -531,9 +678,7 @@ class MonitoringAgent:
                 'low': low_priority,
                 'none': no_concerns
             },
-            'most_common_flags': dict(sorted(flag_counts.items(), 
-                                           key=lambda x: x[1], 
-                                           reverse=True)[:5])
+            'most_common_flags': dict(flag_counts.most_common(5))
         }
     
     def _prioritize_interventions(self, analyses: List[Dict]) -> List[Dict]:
@@ -541,10 +686,10 @@ class MonitoringAgent:
         
         students_with_issues = [a for a in analyses if a['severity'] != 'none']
         
-        prioritized = sorted(students_with_issues, 
-                           key=lambda x: (severity_order[x['severity']], 
-                                        len(x['flags'])),
-                           reverse=True)
+        # Only the top 20 are reported; nlargest keeps sorted()'s tie order
+        prioritized = heapq.nlargest(20, students_with_issues,
+                                     key=lambda x: (severity_order[x['severity']],
+                                                    len(x['flags'])))
         
         return [{
             'rank': i + 1,
@@ -554,7 +699,42 @@ class MonitoringAgent:
             'flag_count': len(a['flags']),
             'primary_concern': a['flags'][0]['type'] if a['flags'] else 'none',
             'recommendations': a['recommendations']
-        } for i, a in enumerate(prioritized[:20])]
+        } for i, a in enumerate(prioritized)]
+
+
+def _write_analysis(f, analysis: Dict, first: bool):
+    if not first:
+        f.write(',\n')
+    f.write(_dumps(analysis))
+
+
+def _dumps(obj) -> str:
+    # Same layout as json.dumps(obj, indent=2), but encoded natively by
+    # orjson when it is installed. Integer keys (weekly_breakdown) become
+    # strings as with json; non-ASCII text is written as UTF-8 rather than
+    # escaped, so files must be opened as UTF-8
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _load(path: str):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _analyze_student(student_data: Dict, thresholds: Dict, course_info: Dict,
+                     analysis_date: str) -> Dict:
+    # Module-level so it can be pickled into worker processes
+    return StudentAnalyzer(thresholds).analyze_student(student_data, course_info, analysis_date)
+
+
+def _analyze_team(team_data: Dict, course_info: Dict) -> Dict:
+    return TeamAnalyzer().analyze_team(team_data, course_info)
 
 
 def main():
@@ -572,8 +752,7 @@ def main():
     dataset = None
     for path in possible_paths:
         try:
-            with open(path, 'r') as f:
-                dataset = json.load(f)
+            dataset = _load(path)
             print(f"✓ Loaded data from: {path}\n")
             break
         except FileNotFoundError:
@@ -588,12 +767,9 @@ def main():
     # Initialize monitoring agent
     agent = MonitoringAgent()
     
-    # Run analysis
-    results = agent.analyze_course(dataset)
-    
-    # Save full results
-    with open('analysis_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    # Run analysis, streaming full results to disk as each project is done
+    with open('analysis_results.json', 'w', encoding='utf-8') as f:
+        results = agent.write_course_analysis(f, dataset)
     
     # Print summary
     print("\n" + "="*70)
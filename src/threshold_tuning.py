@@ -4,7 +4,7 @@ import numpy as np
 
 DATA_PATH = "analysis_results.json"
 
-with open(DATA_PATH, "r") as f:
+with open(DATA_PATH, "r", encoding="utf-8") as f:
     data = json.load(f)
 
 students = data["individual_analyses"]